@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+
+HOURS_PER_DAY = 24
+FULL_DAY = (0, HOURS_PER_DAY * 60)
+
+
+# hourly coverage per date x role x hour
+@dataclass
+class CoverageGrid:
+    dates: list[str]
+    roles: list[str]
+    required: np.ndarray
+    scheduled: np.ndarray
+    available: np.ndarray
+    # distinct workers available in any role, per date x hour
+    available_any: np.ndarray
+
+    # required minus scheduled, never negative
+    def shortfall(self) -> np.ndarray:
+        return np.clip(self.required - self.scheduled, 0, None)
+
+    # (date, hour, role, missing) for every understaffed hour
+    def understaffed(self) -> list[tuple[str, int, str, int]]:
+        short = self.shortfall()
+        return [
+            (self.dates[d], int(h), self.roles[r], int(short[d, r, h]))
+            for d, r, h in zip(*np.nonzero(short))
+        ]
+
+
+# parse HH:MM into minutes, allowing 24:00 as end of day
+def _to_minutes(value: str) -> int:
+    hours, _, minutes = str(value).strip().partition(":")
+    total = int(hours) * 60 + int(minutes or 0)
+    if not 0 <= total <= FULL_DAY[1]:
+        raise ValueError(f"Time '{value}' is outside the day.")
+    return total
+
+
+# minute window from start/end strings, whole day when missing
+def _window(start: Optional[str], end: Optional[str]) -> Optional[tuple[int, int]]:
+    if not start or not end:
+        return FULL_DAY
+    try:
+        s, e = _to_minutes(start), _to_minutes(end)
+    except ValueError:
+        return None
+    return (s, e) if e > s else None
+
+
+# hour bins [first, last) touched by a minute window, or only the whole hours inside it
+def _hour_bins(window: tuple[int, int], inward: bool = False) -> tuple[int, int]:
+    start, end = window
+    if inward:
+        return -(-start // 60), end // 60
+    return start // 60, -(-end // 60)
+
+
+# merge overlapping [first, last) hour ranges
+def _merge_bins(bins: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for h0, h1 in sorted(bins):
+        if merged and h0 <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], h1))
+        else:
+            merged.append((h0, h1))
+    return merged
+
+
+# list every date in a month
+def month_dates(year: int, month: int) -> list[str]:
+    first = date(year, month, 1)
+    days = calendar.monthrange(year, month)[1]
+    return [str(first + timedelta(days=i)) for i in range(days)]
+
+
+# compute required vs scheduled vs available headcount per hour
+def compute_coverage(
+        dates: list[str],
+        workers: list[dict],
+        schedule: dict,
+        requirements: dict,
+        roles: Optional[list[str]] = None,
+) -> CoverageGrid:
+    if roles is None:
+        found = {role for w in workers for role in w.get("roles", [])}
+        for d in dates:
+            found.update(schedule.get(d, {}).keys())
+            for req in requirements.get(d, {}).values():
+                found.update(req.get("roles_needed", {}).keys())
+        roles = sorted(found)
+
+    date_idx = {d: i for i, d in enumerate(dates)}
+    role_idx = {r: i for i, r in enumerate(roles)}
+
+    # collect (date, role, first hour, end hour) for every interval, then sweep once
+    def sweep(intervals: list[tuple[int, int, int, int, int]], n_roles: int = len(roles)) -> np.ndarray:
+        diff = np.zeros((len(dates), n_roles, HOURS_PER_DAY + 1), dtype=np.int32)
+        if intervals:
+            arr = np.asarray(intervals, dtype=np.int64)
+            np.add.at(diff, (arr[:, 0], arr[:, 1], arr[:, 2]), arr[:, 4])
+            np.add.at(diff, (arr[:, 0], arr[:, 1], arr[:, 3]), -arr[:, 4])
+        return np.cumsum(diff, axis=2)[:, :, :HOURS_PER_DAY]
+
+    required_intervals = []
+    event_windows: dict[tuple[str, str], tuple[int, int]] = {}
+    for d, events in requirements.items():
+        if d not in date_idx:
+            continue
+        for event_name, req in events.items():
+            window = _window(req.get("start_time"), req.get("end_time"))
+            if window is None:
+                continue
+            event_windows[(d, event_name)] = window
+            h0, h1 = _hour_bins(window)
+            for role, count in req.get("roles_needed", {}).items():
+                if role in role_idx and count:
+                    required_intervals.append((date_idx[d], role_idx[role], h0, h1, int(count)))
+
+    scheduled_intervals = []
+    for d, by_role in schedule.items():
+        if d not in date_idx:
+            continue
+        for role, staff in by_role.items():
+            if role not in role_idx:
+                continue
+            for person in staff:
+                if person.get("start_time"):
+                    window = _window(person.get("start_time"), person.get("end_time"))
+                else:
+                    window = event_windows.get((d, person.get("event", "")), FULL_DAY)
+                if window is None:
+                    continue
+                h0, h1 = _hour_bins(window)
+                scheduled_intervals.append((date_idx[d], role_idx[role], h0, h1, 1))
+
+    # a worker counts as available only for whole hours inside a window,
+    # and once per hour however many of their windows overlap it
+    available_intervals = []
+    available_any_intervals = []
+    for worker in workers:
+        worker_roles = [role_idx[r] for r in worker.get("roles", []) if r in role_idx]
+        if not worker_roles:
+            continue
+        for d, times in worker.get("availability", {}).items():
+            if d not in date_idx:
+                continue
+            bins = []
+            for slot in times:
+                start, _, end = str(slot).partition("-")
+                if not start or not end:
+                    continue
+                window = _window(start, end)
+                if window is None:
+                    continue
+                h0, h1 = _hour_bins(window, inward=True)
+                if h1 > h0:
+                    bins.append((h0, h1))
+            for h0, h1 in _merge_bins(bins):
+                available_any_intervals.append((date_idx[d], 0, h0, h1, 1))
+                for r in worker_roles:
+                    available_intervals.append((date_idx[d], r, h0, h1, 1))
+
+    return CoverageGrid(
+        dates=list(dates),
+        roles=list(roles),
+        required=sweep(required_intervals),
+        scheduled=sweep(scheduled_intervals),
+        available=sweep(available_intervals),
+        available_any=sweep(available_any_intervals, n_roles=1)[:, 0, :],
+    )
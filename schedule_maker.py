@@ -7,11 +7,23 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from collections import Counter
 
+import schedule_coverage
+import schedule_optimizer
+import schedule_scenarios
+import schedule_store
+from schedule_repository import replace_event_assignments
+
 # GLOBAL DATA
 workers = []
 schedule = {}
+requirements = {}
 DATA_FILE = "workers.json"
 SCHEDULE_FILE = "schedule.json"
+# gzip schedule.json on save; reading detects either form
+SCHEDULE_COMPRESS = os.environ.get("SCHEDULE_COMPRESS", "0") == "1"
+EVENTS_FILE = "events.json"
+REQUIREMENTS_FILE = "requirements.json"
+ASSIGNMENTS_FILE = "weekly_assignments.csv"
 MANAGER_PASSWORD = "UNLV"
 
 # LOAD WORKERS
@@ -27,6 +39,29 @@ def load_workers():
     else:
         # Handle the case where the file doesn't exist
         workers = []
+    if assign_worker_ids():
+        save_workers()
+
+# GENERATE NEW WORKER ID
+def next_worker_id():
+    max_num = 0
+    for worker in workers:
+        s = str(worker.get("id", ""))
+        if s.startswith("W"):
+            try:
+                max_num = max(max_num, int(s[1:]))
+            except ValueError:
+                continue
+    return f"W{max_num + 1:04d}"
+
+# GIVE IDS TO WORKERS MISSING ONE
+def assign_worker_ids():
+    changed = False
+    for worker in workers:
+        if not worker.get("id"):
+            worker["id"] = next_worker_id()
+            changed = True
+    return changed
 
 # SAVE WORKERS
 def save_workers():
@@ -38,23 +73,46 @@ def load_schedule():
     global schedule
     if os.path.exists(SCHEDULE_FILE):
         try:
-            with open(SCHEDULE_FILE, "r") as f:
-                schedule = json.load(f)
-        except json.JSONDecodeError:
+            schedule, legacy = schedule_store.load_schedule_file(SCHEDULE_FILE, workers)
+        except (json.JSONDecodeError, OSError):
             # Handle the case where the file is empty or invalid
-            schedule = {}
+            schedule, legacy = {}, False
+        if legacy:
+            # Rewrite old name/contact copies as worker IDs
+            save_schedule()
     else:
         # Handle the case where the file doesn't exist
         schedule = {}
 
 # SAVE SCHEDULE
 def save_schedule():
-    with open(SCHEDULE_FILE, "w") as f:
-        json.dump(schedule, f, indent=4)
+    schedule_store.write_schedule_file(
+        SCHEDULE_FILE, schedule_store.compact_schedule(schedule, workers), compress=SCHEDULE_COMPRESS
+    )
+
+# LOAD REQUIREMENTS
+def load_requirements():
+    global requirements
+    if os.path.exists(REQUIREMENTS_FILE):
+        try:
+            with open(REQUIREMENTS_FILE, "r") as f:
+                requirements = json.load(f)
+        except json.JSONDecodeError:
+            # Handle the case where the file is empty or invalid
+            requirements = {}
+    else:
+        # Handle the case where the file doesn't exist
+        requirements = {}
+
+# SAVE REQUIREMENTS
+def save_requirements():
+    with open(REQUIREMENTS_FILE, "w") as f:
+        json.dump(requirements, f, indent=4)
 
 # ADD WORKER
 def add_worker():
     worker = {
+        "id": next_worker_id(),
         "name": input("Enter name: ").strip(),
         "contact": f"{random.choice(['***', '***', '***', '***', '***'])}-{random.randint(1000, 9999)}",
         "roles": [r.strip() for r in input("Enter roles (comma-separated): ").strip().split(",") if r.strip()],
@@ -107,8 +165,11 @@ def delete_worker():
         try:
             idx = int(idx) - 1
             if 0 <= idx < len(workers):
+                load_schedule()
                 removed = workers.pop(idx)
                 save_workers()
+                # past shifts keep the removed worker's name inline
+                save_schedule()
                 print(f"Deleted: {removed['name']}")
             else:
                 print("Invalid number.")
@@ -144,6 +205,8 @@ def create_schedule():
     roles_needed = {}
 
     event_date = input("Event date (YYYY-MM-DD): ").strip()
+    start_time = input("Start time (HH:MM, blank for all day): ").strip()
+    end_time = input("End time (HH:MM, blank for all day): ").strip() if start_time else ""
     while True:
         role = input("Role needed (or blank to finish): ").strip()
         if not role:
@@ -156,7 +219,7 @@ def create_schedule():
         qualified = []
         for worker in workers:
             if role in worker["roles"] and event_date in worker["availability"]:
-                qualified.append({"name": worker["name"], "contact": worker["contact"], "availability": worker["availability"][event_date]})
+                qualified.append({"id": worker["id"], "name": worker["name"], "contact": worker["contact"], "availability": worker["availability"][event_date]})
 
         for _ in range(needed):
             if not qualified:
@@ -172,7 +235,10 @@ def create_schedule():
                     choice = int(choice) - 1
                     if 0 <= choice < len(qualified):
                         selected = qualified.pop(choice)
-                        assigned[role] = assigned.get(role, []) + [{"name": selected["name"], "contact": selected["contact"]}]
+                        person = {"id": selected["id"], "name": selected["name"], "contact": selected["contact"], "event": "Event"}
+                        if start_time and end_time:
+                            person.update({"start_time": start_time, "end_time": end_time})
+                        assigned[role] = assigned.get(role, []) + [person]
                     else:
                         print("Invalid choice.")
                 except ValueError:
@@ -180,16 +246,133 @@ def create_schedule():
 
     schedule[event_date] = assigned
     save_schedule()
+    requirements[event_date] = {"Event": {"start_time": start_time, "end_time": end_time, "roles_needed": roles_needed}}
+    save_requirements()
     print("Schedule created and saved.")
 
+# STAFF EVENTS AND SAVE TO ALL STORES
+def run_event_optimization(events, time_limit=5.0):
+    schedule_optimizer.check_unique_events(events)
+
+    # a run owns only its own events; other events on the same dates stay and block overlaps
+    rerun = {(str(e.event_date), e.name) for e in events}
+    updated = {}
+    for event_date, roles in schedule.items():
+        kept_roles = {}
+        for role, staff in roles.items():
+            kept = [p for p in staff if (event_date, p.get("event", "")) not in rerun]
+            if kept:
+                kept_roles[role] = kept
+        if kept_roles:
+            updated[event_date] = kept_roles
+
+    existing_shifts = []
+    for event_date, roles in updated.items():
+        try:
+            shift_date = datetime.strptime(event_date, "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        for staff in roles.values():
+            for p in staff:
+                if p.get("id") and p.get("start_time") and p.get("end_time"):
+                    existing_shifts.append((p["id"], shift_date, p["start_time"], p["end_time"]))
+
+    result = schedule_optimizer.optimize_schedule(
+        events, workers, time_limit=time_limit, existing_shifts=existing_shifts
+    )
+
+    # write the assignments file first so a failure there leaves schedule.json untouched;
+    # clear every input event, including ones that got no shifts filled this time
+    replace_event_assignments(
+        schedule_optimizer.result_to_assignment_rows(result),
+        ASSIGNMENTS_FILE,
+        keys=schedule_optimizer.event_assignment_keys(events),
+    )
+
+    for event_date, roles in schedule_optimizer.result_to_schedule(result, workers).items():
+        for role, staff in roles.items():
+            updated.setdefault(event_date, {}).setdefault(role, []).extend(staff)
+    schedule.clear()
+    schedule.update(updated)
+    save_schedule()
+
+    for event in events:
+        requirements.setdefault(str(event.event_date), {})[event.name] = {
+            "start_time": event.start_time,
+            "end_time": event.end_time,
+            "roles_needed": event.roles_needed,
+        }
+    save_requirements()
+    return result
+
+# OPTIMIZE MULTI-EVENT SCHEDULE
+def optimize_event_schedule():
+    path = input(f"Events file [{EVENTS_FILE}]: ").strip() or EVENTS_FILE
+    limit = input("Time limit in seconds [5]: ").strip()
+    try:
+        time_limit = float(limit) if limit else 5.0
+        events = schedule_optimizer.load_events(path)
+    except (OSError, ValueError) as exc:
+        print(f"Could not load events: {exc}")
+        return
+
+    result = run_event_optimization(events, time_limit)
+
+    print(f"Filled {len(result.assignments)} of {result.total_needed} shifts "
+          f"({result.fill_rate:.0%}) in {result.elapsed_seconds:.2f}s.")
+    if result.timed_out:
+        print("Time limit reached – result may not be the best possible.")
+    for (name, event_date, role), missing in result.unfilled.items():
+        print(f"   ⚠️  {event_date} {name}: {missing} {role} short")
+
+# WHAT-IF STAFFING SCENARIOS
+def what_if_scenarios():
+    event_date = input("Event date (YYYY-MM-DD): ").strip()
+    start_time = input("Start time (HH:MM): ").strip()
+    end_time = input("End time (HH:MM): ").strip()
+    print("Enter one plan per line, e.g. Security=20, Usher=5 (blank to run).")
+    variants = []
+    while True:
+        line = input(f"Plan {len(variants) + 1}: ").strip()
+        if not line:
+            break
+        try:
+            plan = {}
+            for part in line.split(","):
+                role, count = part.split("=")
+                plan[role.strip()] = int(count)
+            variants.append(plan)
+        except ValueError:
+            print("Invalid plan. Use Role=Count, separated by commas.")
+
+    if not variants:
+        print("No plans entered.")
+        return
+
+    try:
+        results = schedule_scenarios.run_roles_needed_variants(variants, event_date, start_time, end_time, workers)
+    except ValueError as exc:
+        print(f"Could not run scenarios: {exc}")
+        return
+
+    print(f"\n{'Plan':<12}{'Filled':>10}{'Fill %':>9}{'Spread (h)':>12}")
+    for result in results:
+        print(f"{result.name:<12}{result.filled:>5}/{result.needed:<4}{result.fill_rate:>9.0%}{result.fairness_spread:>12.1f}")
+        for (_, _, role), missing in result.unfilled.items():
+            print(f"   ⚠️  {missing} {role} short")
+
 # VIEW SCHEDULE
-def view_schedule(roles_needed):
+def view_schedule():
     load_schedule()
+    load_requirements()
     if not schedule:
         print("No schedule found.")
         return
 
     for date, roles in schedule.items():
+        roles_needed = Counter()
+        for req in requirements.get(date, {}).values():
+            roles_needed.update(req.get("roles_needed", {}))
         print(f"\nSCHEDULE FOR {date}")
         print("-" * 50)
         for role, staff in roles.items():
@@ -225,7 +408,7 @@ def generate_availability():
 def main_menu():
     load_workers()
     load_schedule()
-    roles_needed = {}
+    load_requirements()
 
     while True:
         print("\n" + "=" * 40)
@@ -239,6 +422,8 @@ def main_menu():
         print("6. Create Schedule")
         print("7. View Schedule")
         print("8. Data Analysis")
+        print("9. Optimize Multi-Event Schedule")
+        print("10. What-If Staffing Scenarios")
         print("0. Exit")
         choice = input("\nSelect option: ").strip()
 
@@ -255,9 +440,13 @@ def main_menu():
         elif choice == "6":
             create_schedule()
         elif choice == "7":
-            view_schedule(roles_needed)
+            view_schedule()
         elif choice == "8":
             analytics_menu()
+        elif choice == "9":
+            optimize_event_schedule()
+        elif choice == "10":
+            what_if_scenarios()
         elif choice == "0":
             print("Goodbye!")
             break
@@ -328,19 +517,18 @@ def plot_availability_heatmap():
 
 # Chart 3 – Shifts per Worker (Fairness Check)
 def plot_shifts_per_worker():
-    schedule_file = "schedule.json"
-    if not os.path.exists(schedule_file):
+    if not os.path.exists(SCHEDULE_FILE):
         print("No schedule file found – generate a schedule first.")
         return
 
-    import json
-    with open(schedule_file, "r") as f:
-        schedule = json.load(f)
+    load_workers()
+    load_schedule()
 
     worker_shift_count = Counter()
-    for role, assignments in schedule.items():
-        for assignment in assignments:
-            worker_shift_count[assignment["name"]] += 1
+    for roles in schedule.values():
+        for assignments in roles.values():
+            for assignment in assignments:
+                worker_shift_count[assignment["name"]] += 1
 
     if not worker_shift_count:
         print("Schedule is empty.")
@@ -363,6 +551,56 @@ def plot_shifts_per_worker():
     plt.tight_layout()
     plt.show()
 
+# Chart 4 – Hourly Coverage Heatmap for a month
+def plot_coverage_heatmap():
+    month_str = input("Month (YYYY-MM): ").strip()
+    try:
+        year, month = (int(part) for part in month_str.split("-"))
+        dates = schedule_coverage.month_dates(year, month)
+    except ValueError:
+        print("Invalid month. Use YYYY-MM.")
+        return
+    role = input("Role (blank for all roles): ").strip()
+
+    load_workers()
+    load_schedule()
+    load_requirements()
+    grid = schedule_coverage.compute_coverage(dates, workers, schedule, requirements)
+    if role and role not in grid.roles:
+        print(f"No data for role '{role}'.")
+        return
+
+    role_slice = [grid.roles.index(role)] if role else slice(None)
+    required = grid.required[:, role_slice, :].sum(axis=1)
+    scheduled = grid.scheduled[:, role_slice, :].sum(axis=1)
+    # a worker with several roles is one person, so all roles use the distinct count
+    available = grid.available[:, role_slice, :].sum(axis=1) if role else grid.available_any
+    if not required.any() and not scheduled.any():
+        print("No requirements or shifts in that month.")
+        return
+
+    # negative = understaffed, positive = over-scheduled
+    balance = scheduled - required
+    limit = max(abs(balance).max(), 1)
+
+    plt.figure(figsize=(12, 9))
+    plt.imshow(balance, aspect="auto", cmap="RdYlGn", vmin=-limit, vmax=limit)
+    plt.colorbar(label="Scheduled − Required")
+    plt.title(f"Hourly Coverage {month_str} ({role or 'All Roles'})", fontsize=16, fontweight="bold")
+    plt.xlabel("Hour of Day")
+    plt.ylabel("Date")
+    plt.xticks(range(24), [f"{h:02d}" for h in range(24)])
+    plt.yticks(range(len(dates)), [d[5:] for d in dates])
+
+    # mark hours that could not be covered even with everyone available
+    short_rows, short_cols = ((required > available) & (required > 0)).nonzero()
+    plt.scatter(short_cols, short_rows, marker="x", color="black", s=20, label="Not enough available")
+    if len(short_rows):
+        plt.legend(loc="upper right")
+
+    plt.tight_layout()
+    plt.show()
+
 # Master Analytics Menu
 def analytics_menu():
     while True:
@@ -372,6 +610,7 @@ def analytics_menu():
         print("1. Role Distribution Bar Chart")
         print("2. 7-Day Availability Heatmap")
         print("3. Shifts per Worker (Fairness)")
+        print("4. Hourly Coverage Heatmap (Month)")
         print("0. Back to Main Menu")
         choice = input("Choose report » ").strip()
 
@@ -381,6 +620,8 @@ def analytics_menu():
             plot_availability_heatmap()
         elif choice == "3":
             plot_shifts_per_worker()
+        elif choice == "4":
+            plot_coverage_heatmap()
         elif choice == "0":
             break
         else:
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from schedule_repository import DAYS_OF_WEEK, _parse_week_ending
+
+
+# define event class
+@dataclass(frozen=True)
+class Event:
+    name: str
+    event_date: date
+    start_time: str
+    end_time: str
+    roles_needed: dict[str, int] = field(default_factory=dict)
+
+
+# one booked shift
+@dataclass(frozen=True)
+class ShiftAssignment:
+    event: Event
+    role: str
+    worker_id: str
+
+
+# result of an optimization run
+@dataclass
+class OptimizationResult:
+    assignments: list[ShiftAssignment]
+    unfilled: dict[tuple[str, date, str], int]
+    elapsed_seconds: float
+    timed_out: bool = False
+
+    @property
+    def total_needed(self) -> int:
+        return len(self.assignments) + sum(self.unfilled.values())
+
+    @property
+    def fill_rate(self) -> float:
+        total = self.total_needed
+        return len(self.assignments) / total if total else 1.0
+
+
+# parse HH:MM into minutes after midnight
+def _parse_hhmm(value: str) -> int:
+    s = str(value).strip()
+    try:
+        parsed = datetime.strptime(s, "%H:%M")
+    except ValueError:
+        raise ValueError(f"Could not parse time '{value}'. Use 'HH:MM'.") from None
+    return parsed.hour * 60 + parsed.minute
+
+
+# parse "HH:MM-HH:MM" into minute window
+def _parse_interval(value: str) -> tuple[int, int]:
+    parts = str(value).split("-")
+    if len(parts) != 2:
+        raise ValueError(f"Could not parse time window '{value}'. Use 'HH:MM-HH:MM'.")
+    start, end = _parse_hhmm(parts[0]), _parse_hhmm(parts[1])
+    if end <= start:
+        raise ValueError(f"Time window '{value}' must end after it starts.")
+    return start, end
+
+
+# minute window of an event
+def _event_window(event: Event) -> tuple[int, int]:
+    start, end = _parse_hhmm(event.start_time), _parse_hhmm(event.end_time)
+    if end <= start:
+        raise ValueError(f"Event '{event.name}' on {event.event_date} must end after it starts.")
+    return start, end
+
+
+# parse event date
+def _parse_event_date(value: str | date) -> date:
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value).strip(), "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Could not parse event date '{value}'. Use 'YYYY-MM-DD'.") from None
+
+
+# build event from dict
+def event_from_dict(data: dict) -> Event:
+    roles_needed = {}
+    for role, count in (data.get("roles_needed") or {}).items():
+        count = int(count)
+        if count < 0:
+            raise ValueError(f"Headcount for role '{role}' cannot be negative.")
+        if count:
+            roles_needed[str(role).strip()] = count
+
+    event = Event(
+        name=str(data.get("name") or "").strip(),
+        event_date=_parse_event_date(data.get("date", "")),
+        start_time=str(data.get("start_time") or "").strip(),
+        end_time=str(data.get("end_time") or "").strip(),
+        roles_needed=roles_needed,
+    )
+    if not event.name:
+        raise ValueError("Every event needs a name.")
+    _event_window(event)
+    return event
+
+
+# load events from json
+def load_events(path: str | os.PathLike = "events.json") -> list[Event]:
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"events file not found at: {path.resolve()}")
+
+    with open(path, "r") as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, list):
+        raise ValueError("events file must contain a list of events.")
+
+    events = [event_from_dict(item) for item in raw]
+    check_unique_events(events)
+    return events
+
+
+# events are keyed by (date, name) downstream, so names must be unique per day
+def check_unique_events(events: list[Event]) -> None:
+    seen = set()
+    for event in events:
+        key = (event.event_date, event.name)
+        if key in seen:
+            raise ValueError(f"Duplicate event '{event.name}' on {event.event_date}. Give each event on a day its own name.")
+        seen.add(key)
+
+
+# check availability covers the full shift
+def worker_covers(worker: dict, event: Event) -> bool:
+    start, end = _event_window(event)
+    for window in worker.get("availability", {}).get(str(event.event_date), []):
+        try:
+            avail_start, avail_end = _parse_interval(window)
+        except ValueError:
+            continue
+        if avail_start <= start and end <= avail_end:
+            return True
+    return False
+
+
+# optimize all events jointly
+def optimize_schedule(
+        events: list[Event],
+        workers: list[dict],
+        time_limit: float = 5.0,
+        existing_shifts: Iterable[tuple[str, date, str, str]] = (),
+) -> OptimizationResult:
+    started = time.perf_counter()
+    deadline = started + max(time_limit, 0.0)
+
+    windows = [_event_window(event) for event in events]
+
+    # shifts already booked outside this run: (worker id, date, start, end)
+    fixed: dict[str, list[tuple[date, int, int]]] = {}
+    for worker_id, shift_date, start_time, end_time in existing_shifts:
+        try:
+            start, end = _parse_hhmm(start_time), _parse_hhmm(end_time)
+        except ValueError:
+            continue
+        fixed.setdefault(str(worker_id), []).append((shift_date, start, end))
+
+    def clashes_with_fixed(worker: dict, event_idx: int) -> bool:
+        start, end = windows[event_idx]
+        return any(
+            shift_date == events[event_idx].event_date and start < other_end and other_start < end
+            for shift_date, other_start, other_end in fixed.get(str(worker.get("id")), [])
+        )
+
+    # one slot per (event, role) pair with its headcount and qualified workers
+    slots: list[tuple[int, str]] = []
+    needed: list[int] = []
+    candidates: list[list[int]] = []
+    for event_idx, event in enumerate(events):
+        for role, count in event.roles_needed.items():
+            slots.append((event_idx, role))
+            needed.append(count)
+            candidates.append([
+                w_idx for w_idx, worker in enumerate(workers)
+                if role in worker.get("roles", []) and worker_covers(worker, event)
+                and not clashes_with_fixed(worker, event_idx)
+            ])
+
+    # per-worker bookings: list of slot indexes, plus minutes for fairness
+    booked: list[list[int]] = [[] for _ in workers]
+    booked_minutes = [
+        sum(end - start for _, start, end in fixed.get(str(worker.get("id")), []))
+        for worker in workers
+    ]
+    filled: list[list[int]] = [[] for _ in slots]
+
+    def conflicts(w_idx: int, slot_idx: int) -> list[int]:
+        event_idx = slots[slot_idx][0]
+        event_date = events[event_idx].event_date
+        start, end = windows[event_idx]
+        clashing = []
+        for other in booked[w_idx]:
+            other_event = slots[other][0]
+            if events[other_event].event_date != event_date:
+                continue
+            other_start, other_end = windows[other_event]
+            if start < other_end and other_start < end:
+                clashing.append(other)
+        return clashing
+
+    def book(w_idx: int, slot_idx: int) -> None:
+        start, end = windows[slots[slot_idx][0]]
+        booked[w_idx].append(slot_idx)
+        booked_minutes[w_idx] += end - start
+        filled[slot_idx].append(w_idx)
+
+    def unbook(w_idx: int, slot_idx: int) -> None:
+        start, end = windows[slots[slot_idx][0]]
+        booked[w_idx].remove(slot_idx)
+        booked_minutes[w_idx] -= end - start
+        filled[slot_idx].remove(w_idx)
+
+    # fill a seat directly, or by moving a blocked worker's one clashing shift to someone else
+    def repair(slot_idx: int) -> bool:
+        for w_idx in sorted(candidates[slot_idx], key=lambda w: (booked_minutes[w], w)):
+            if w_idx in filled[slot_idx]:
+                continue
+            clashing = conflicts(w_idx, slot_idx)
+            if not clashing:
+                book(w_idx, slot_idx)
+                return True
+            if len(clashing) != 1:
+                continue
+
+            other_slot = clashing[0]
+            unbook(w_idx, other_slot)
+            for replacement in sorted(candidates[other_slot], key=lambda w: (booked_minutes[w], w)):
+                if replacement == w_idx or replacement in filled[other_slot]:
+                    continue
+                if not conflicts(replacement, other_slot):
+                    book(replacement, other_slot)
+                    book(w_idx, slot_idx)
+                    return True
+            book(w_idx, other_slot)
+        return False
+
+    # greedy pass: scarcest slots first, least-loaded worker first
+    order = sorted(
+        range(len(slots)),
+        key=lambda i: (len(candidates[i]) - needed[i], events[slots[i][0]].event_date, windows[slots[i][0]][0]),
+    )
+    for slot_idx in order:
+        pool = sorted(candidates[slot_idx], key=lambda w: (booked_minutes[w], w))
+        for w_idx in pool:
+            if len(filled[slot_idx]) >= needed[slot_idx]:
+                break
+            if not conflicts(w_idx, slot_idx):
+                book(w_idx, slot_idx)
+
+    # repair pass until nothing improves or time runs out
+    timed_out = False
+    improved = True
+    while improved:
+        improved = False
+        for slot_idx in order:
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            while len(filled[slot_idx]) < needed[slot_idx]:
+                if not repair(slot_idx):
+                    break
+                improved = True
+        if timed_out:
+            break
+
+    assignments = []
+    unfilled: dict[tuple[str, date, str], int] = {}
+    for slot_idx, (event_idx, role) in enumerate(slots):
+        event = events[event_idx]
+        for w_idx in filled[slot_idx]:
+            assignments.append(ShiftAssignment(event=event, role=role, worker_id=str(workers[w_idx]["id"])))
+        missing = needed[slot_idx] - len(filled[slot_idx])
+        if missing:
+            key = (event.name, event.event_date, role)
+            unfilled[key] = unfilled.get(key, 0) + missing
+
+    assignments.sort(key=lambda a: (a.event.event_date, a.event.start_time, a.event.name, a.role))
+
+    return OptimizationResult(
+        assignments=assignments,
+        unfilled=unfilled,
+        elapsed_seconds=time.perf_counter() - started,
+        timed_out=timed_out,
+    )
+
+
+# convert result into schedule.json layout
+def result_to_schedule(result: OptimizationResult, workers: list[dict]) -> dict[str, dict[str, list[dict]]]:
+    by_id = {str(w["id"]): w for w in workers}
+    schedule: dict[str, dict[str, list[dict]]] = {}
+    for a in result.assignments:
+        worker = by_id[a.worker_id]
+        day = schedule.setdefault(str(a.event.event_date), {})
+        day.setdefault(a.role, []).append({
+            "id": a.worker_id,
+            "name": worker["name"],
+            "contact": worker["contact"],
+            "event": a.event.name,
+            "start_time": a.event.start_time,
+            "end_time": a.event.end_time,
+        })
+    return schedule
+
+
+# week ending sunday for a date
+def week_ending_for(value: str | date) -> date:
+    d = _parse_week_ending(value)
+    return d + timedelta(days=6 - d.weekday())
+
+
+# convert result into weekly_assignments rows
+def result_to_assignment_rows(result: OptimizationResult) -> list[dict]:
+    rows = []
+    for a in result.assignments:
+        rows.append({
+            "WeekEndingSunday": week_ending_for(a.event.event_date),
+            "EmployeeID": a.worker_id,
+            "DayOfWeek": DAYS_OF_WEEK[a.event.event_date.weekday()],
+            "EventName": a.event.name,
+            "StartTime": a.event.start_time,
+            "EndTime": a.event.end_time,
+            "Notes": a.role,
+        })
+    return rows
+
+
+# (week, day, event) keys covered by a set of events
+def event_assignment_keys(events: list[Event]) -> list[tuple[date, str, str]]:
+    return [
+        (week_ending_for(event.event_date), DAYS_OF_WEEK[event.event_date.weekday()], event.name)
+        for event in events
+    ]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterable, Optional
@@ -100,7 +102,8 @@ def load_assignments_df(
         df = pd.DataFrame(columns=ASSIGNMENT_COLUMNS)
         return df
 
-    df = pd.read_csv(path, dtype={"EmployeeID": str, "AssignmentID": str})
+    # keep text columns as strings so blank cells stay "" rather than NaN
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
 
     for col in ASSIGNMENT_COLUMNS:
         if col not in df.columns:
@@ -119,7 +122,8 @@ def _write_assignments_df(df: pd.DataFrame, path: str | os.PathLike = "weekly_as
     _ensure_parent_dir(path)
 
     temp_path = path.with_suffix(path.suffix + ".tmp")
-    df.to_csv(temp_path, index=False, lineterminator="\n")
+    # always write the header, even when there are no rows left
+    df.reindex(columns=ASSIGNMENT_COLUMNS).to_csv(temp_path, index=False, lineterminator="\n")
     temp_path.replace(path)
 
 
@@ -141,6 +145,228 @@ def _generate_new_assignment_id(existing_ids: Iterable[str]) -> str:
     return f"A{new_num:04d}"
 
 
+# (week, employee) cells changed since the last export refresh, per assignments file
+_dirty_cells: dict[Path, set[tuple[date, str]]] = {}
+
+# content hash of each weekly export we know about, with the (mtime, size) it was taken at
+_export_hashes: dict[Path, tuple[str, int, int]] = {}
+
+
+# mark (week, employee) cells as needing re-export
+def _mark_dirty(assignments_csv: str | os.PathLike, cells: Iterable[tuple[date, str]]) -> None:
+    dirty = _dirty_cells.setdefault(Path(assignments_csv).resolve(), set())
+    for week_date, employee_id in cells:
+        dirty.add((_parse_week_ending(week_date), str(employee_id)))
+
+
+# cells touched by rows of an assignments df
+def _cells_for_rows(df: pd.DataFrame) -> list[tuple[date, str]]:
+    return list(zip(df["WeekEndingSunday"], df["EmployeeID"].astype(str)))
+
+
+# list dirty cells
+def get_dirty_cells(assignments_csv: str | os.PathLike = "weekly_assignments.csv") -> set[tuple[date, str]]:
+    return set(_dirty_cells.get(Path(assignments_csv).resolve(), set()))
+
+
+# list weeks with dirty cells
+def get_dirty_weeks(assignments_csv: str | os.PathLike = "weekly_assignments.csv") -> set[date]:
+    return {week_date for week_date, _ in get_dirty_cells(assignments_csv)}
+
+
+# per-employee totals for one week
+@dataclass(frozen=True)
+class EmployeeWeekSummary:
+    week_ending: date
+    employee_id: str
+    total_hours: float = 0.0
+    days_worked: tuple[str, ...] = ()
+    shifts: tuple[dict, ...] = ()
+
+
+# materialized summaries for one assignments file
+@dataclass
+class _SummaryIndex:
+    stamp: Optional[tuple[int, int]]
+    shifts: dict[tuple[date, str], dict[str, dict]] = field(default_factory=dict)
+    summaries: dict[tuple[date, str], EmployeeWeekSummary] = field(default_factory=dict)
+    weeks: dict[date, set[str]] = field(default_factory=dict)
+
+
+# summary index per assignments file
+_summary_indexes: dict[Path, _SummaryIndex] = {}
+
+
+# blank out NaN cells from csv
+def _clean(value) -> str:
+    return "" if pd.isna(value) else str(value).strip()
+
+
+# shift length in hours, wrapping past midnight
+def _shift_hours(start_time: str, end_time: str) -> float:
+    try:
+        start = datetime.strptime(start_time, "%H:%M")
+        end = datetime.strptime(end_time, "%H:%M")
+    except ValueError:
+        return 0.0
+    minutes = (end - start).seconds // 60
+    return round(minutes / 60, 2)
+
+
+# recompute one (week, employee) summary from its shifts
+def _refresh_summary(index: _SummaryIndex, cell: tuple[date, str]) -> None:
+    shifts = index.shifts.get(cell, {})
+    week_date, employee_id = cell
+
+    if not shifts:
+        index.shifts.pop(cell, None)
+        index.summaries.pop(cell, None)
+        index.weeks.get(week_date, set()).discard(employee_id)
+        return
+
+    ordered = sorted(
+        shifts.values(),
+        key=lambda s: (DAYS_OF_WEEK.index(s["DayOfWeek"]) if s["DayOfWeek"] in DAYS_OF_WEEK else 7, s["StartTime"]),
+    )
+    days = tuple(day for day in DAYS_OF_WEEK if any(s["DayOfWeek"] == day for s in ordered))
+    index.summaries[cell] = EmployeeWeekSummary(
+        week_ending=week_date,
+        employee_id=employee_id,
+        total_hours=round(sum(s["Hours"] for s in ordered), 2),
+        days_worked=days,
+        shifts=tuple(ordered),
+    )
+    index.weeks.setdefault(week_date, set()).add(employee_id)
+
+
+# add or remove assignment rows from an index
+def _apply_summary_rows(index: _SummaryIndex, rows: Optional[pd.DataFrame], remove: bool) -> set[tuple[date, str]]:
+    touched = set()
+    if rows is None:
+        return touched
+    for row in rows.to_dict(orient="records"):
+        cell = (_parse_week_ending(row["WeekEndingSunday"]), str(row["EmployeeID"]))
+        assignment_id = str(row["AssignmentID"])
+        if remove:
+            index.shifts.get(cell, {}).pop(assignment_id, None)
+        else:
+            start_time, end_time = _clean(row.get("StartTime")), _clean(row.get("EndTime"))
+            index.shifts.setdefault(cell, {})[assignment_id] = {
+                "AssignmentID": assignment_id,
+                "DayOfWeek": _clean(row.get("DayOfWeek")),
+                "EventName": _clean(row.get("EventName")),
+                "StartTime": start_time,
+                "EndTime": end_time,
+                "Notes": _clean(row.get("Notes")),
+                "Hours": _shift_hours(start_time, end_time),
+            }
+        touched.add(cell)
+    return touched
+
+
+# get summary index, building it from the csv when missing or edited elsewhere
+def _get_summary_index(assignments_csv: str | os.PathLike) -> _SummaryIndex:
+    key = Path(assignments_csv).resolve()
+    stamp = _file_stamp(assignments_csv)
+    index = _summary_indexes.get(key)
+    if index is not None and index.stamp == stamp:
+        return index
+
+    index = _SummaryIndex(stamp=stamp)
+    df = load_assignments_df(assignments_csv, create_if_missing=True)
+    for cell in _apply_summary_rows(index, df, remove=False):
+        _refresh_summary(index, cell)
+    _summary_indexes[key] = index
+    return index
+
+
+# keep an existing summary index in step with a mutation
+def _update_summaries(
+        assignments_csv: str | os.PathLike,
+        previous_stamp: Optional[tuple[int, int]],
+        removed: Optional[pd.DataFrame] = None,
+        added: Optional[pd.DataFrame] = None,
+) -> None:
+    key = Path(assignments_csv).resolve()
+    index = _summary_indexes.get(key)
+    if index is None:
+        return
+    if index.stamp != previous_stamp:
+        # file changed outside this module; rebuild on next lookup
+        del _summary_indexes[key]
+        return
+
+    touched = _apply_summary_rows(index, removed, remove=True)
+    touched |= _apply_summary_rows(index, added, remove=False)
+    for cell in touched:
+        _refresh_summary(index, cell)
+    index.stamp = _file_stamp(assignments_csv)
+
+
+# look up one employee's week
+def get_employee_week_summary(
+        week_ending: str | date,
+        employee_id: str,
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+) -> EmployeeWeekSummary:
+    week_date = _parse_week_ending(week_ending)
+    index = _get_summary_index(assignments_csv)
+    cell = (week_date, str(employee_id))
+    return index.summaries.get(cell) or EmployeeWeekSummary(week_ending=week_date, employee_id=str(employee_id))
+
+
+# look up hours worked in a week
+def get_employee_week_hours(
+        week_ending: str | date,
+        employee_id: str,
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+) -> float:
+    return get_employee_week_summary(week_ending, employee_id, assignments_csv).total_hours
+
+
+# list all employee summaries for a week
+def list_week_summaries(
+        week_ending: str | date,
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+) -> list[EmployeeWeekSummary]:
+    week_date = _parse_week_ending(week_ending)
+    index = _get_summary_index(assignments_csv)
+    return [index.summaries[(week_date, emp_id)] for emp_id in sorted(index.weeks.get(week_date, set()))]
+
+
+# build payroll-style totals for a week
+def build_payroll_summary_df(
+        week_ending: str | date,
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+) -> pd.DataFrame:
+    rows = [
+        {
+            "EmployeeID": summary.employee_id,
+            "WeekEndingSunday": summary.week_ending,
+            "TotalHours": summary.total_hours,
+            "DaysWorked": len(summary.days_worked),
+            "Shifts": len(summary.shifts),
+        }
+        for summary in list_week_summaries(week_ending, assignments_csv)
+    ]
+    return pd.DataFrame(rows, columns=["EmployeeID", "WeekEndingSunday", "TotalHours", "DaysWorked", "Shifts"])
+
+
+# save payroll totals to csv
+def save_payroll_summary_csv(
+        week_ending: str | date,
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+        output_dir: str | os.PathLike = ".",
+) -> Path:
+    week_date = _parse_week_ending(week_ending)
+    filename = f"{week_date.month}_{week_date.day}_{week_date.year}_Week_Ending_Payroll.csv"
+    output_path = Path(output_dir) / filename
+
+    _ensure_parent_dir(output_path)
+    build_payroll_summary_df(week_date, assignments_csv).to_csv(output_path, index=False, lineterminator="\n")
+    return output_path
+
+
 # create new assignment
 def create_assignment(
         week_ending: str | date,
@@ -158,6 +384,7 @@ def create_assignment(
     if day_of_week not in DAYS_OF_WEEK:
         raise ValueError(f"Invalid DayOfWeek '{day_of_week}'. Must be one of {DAYS_OF_WEEK}.")
 
+    previous_stamp = _file_stamp(assignments_csv)
     df = load_assignments_df(assignments_csv, create_if_missing=True)
     new_id = _generate_new_assignment_id(df["AssignmentID"].tolist())
 
@@ -174,6 +401,8 @@ def create_assignment(
 
     df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
     _write_assignments_df(df, assignments_csv)
+    _mark_dirty(assignments_csv, [(week_date, employee_id)])
+    _update_summaries(assignments_csv, previous_stamp, added=pd.DataFrame([new_row]))
 
     return Assignment(
         assignment_id=new_id,
@@ -187,6 +416,55 @@ def create_assignment(
     )
 
 
+# replace assignments for the same week/day/event with new rows
+def replace_event_assignments(
+        rows: Iterable[dict],
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+        keys: Optional[Iterable[tuple[str | date, str, str]]] = None,
+) -> list[str]:
+    previous_stamp = _file_stamp(assignments_csv)
+    df = load_assignments_df(assignments_csv, create_if_missing=True)
+
+    new_rows = []
+    for row in rows:
+        day_of_week = str(row["DayOfWeek"]).strip()
+        if day_of_week not in DAYS_OF_WEEK:
+            raise ValueError(f"Invalid DayOfWeek '{day_of_week}'. Must be one of {DAYS_OF_WEEK}.")
+        new_rows.append({
+            "WeekEndingSunday": _parse_week_ending(row["WeekEndingSunday"]),
+            "EmployeeID": str(row["EmployeeID"]),
+            "DayOfWeek": day_of_week,
+            "EventName": str(row.get("EventName") or "").strip(),
+            "StartTime": str(row.get("StartTime") or "").strip(),
+            "EndTime": str(row.get("EndTime") or "").strip(),
+            "Notes": str(row.get("Notes") or "").strip(),
+        })
+
+    next_num = int(_generate_new_assignment_id(df["AssignmentID"].tolist())[1:])
+    replaced = {(r["WeekEndingSunday"], r["DayOfWeek"], r["EventName"]) for r in new_rows}
+    # (week, day, event) keys to clear even when no new rows were produced for them
+    if keys is not None:
+        replaced |= {(_parse_week_ending(w), str(d).strip(), str(e).strip()) for w, d, e in keys}
+    keys = zip(df["WeekEndingSunday"], df["DayOfWeek"], df["EventName"])
+    keep = pd.Series([key not in replaced for key in keys], index=df.index, dtype=bool)
+    removed = df[~keep]
+    removed_cells = _cells_for_rows(removed)
+    df = df[keep]
+
+    new_ids = []
+    for offset, row in enumerate(new_rows):
+        row["AssignmentID"] = f"A{next_num + offset:04d}"
+        new_ids.append(row["AssignmentID"])
+
+    if new_rows:
+        df = pd.concat([df, pd.DataFrame(new_rows, columns=ASSIGNMENT_COLUMNS)], ignore_index=True)
+    _write_assignments_df(df, assignments_csv)
+    _mark_dirty(assignments_csv, removed_cells + [(r["WeekEndingSunday"], r["EmployeeID"]) for r in new_rows])
+    _update_summaries(assignments_csv, previous_stamp, removed=removed, added=pd.DataFrame(new_rows, columns=ASSIGNMENT_COLUMNS))
+
+    return new_ids
+
+
 # list assignments for week
 def list_assignments_for_week(
         week_ending: str | date,
@@ -204,9 +482,11 @@ def list_assignments_for_employee_week(
         assignments_csv: str | os.PathLike = "weekly_assignments.csv",
 ) -> pd.DataFrame:
     week_date = _parse_week_ending(week_ending)
-    df = load_assignments_df(assignments_csv, create_if_missing=True)
-    mask = (df["WeekEndingSunday"] == week_date) & (df["EmployeeID"] == str(employee_id))
-    return df[mask].copy()
+    shifts = _get_summary_index(assignments_csv).shifts.get((week_date, str(employee_id)), {})
+    # ids only grow, so id order is file order
+    ordered = sorted(shifts.values(), key=lambda s: (len(s["AssignmentID"]), s["AssignmentID"]))
+    rows = [dict(s, WeekEndingSunday=week_date, EmployeeID=str(employee_id)) for s in ordered]
+    return pd.DataFrame(rows, columns=ASSIGNMENT_COLUMNS)
 
 
 # update existing assignment
@@ -220,11 +500,13 @@ def update_assignment(
         day_of_week: Optional[str] = None,
         assignments_csv: str | os.PathLike = "weekly_assignments.csv",
 ) -> None:
+    previous_stamp = _file_stamp(assignments_csv)
     df = load_assignments_df(assignments_csv, create_if_missing=True)
 
     mask = df["AssignmentID"] == str(assignment_id)
     if not mask.any():
         raise ValueError(f"No assignment found with AssignmentID={assignment_id}")
+    before = df[mask].copy()
 
     if day_of_week is not None:
         day_of_week = day_of_week.strip()
@@ -245,6 +527,8 @@ def update_assignment(
         df.loc[mask, "Notes"] = notes.strip()
 
     _write_assignments_df(df, assignments_csv)
+    _mark_dirty(assignments_csv, _cells_for_rows(df[mask]))
+    _update_summaries(assignments_csv, previous_stamp, removed=before, added=df[mask])
 
 
 # delete assignment by id
@@ -252,14 +536,18 @@ def delete_assignment(
         assignment_id: str,
         assignments_csv: str | os.PathLike = "weekly_assignments.csv",
 ) -> None:
+    previous_stamp = _file_stamp(assignments_csv)
     df = load_assignments_df(assignments_csv, create_if_missing=True)
 
     mask = df["AssignmentID"] != str(assignment_id)
     if mask.all():
         raise ValueError(f"No assignment found with AssignmentID={assignment_id}")
 
+    removed = df[~mask]
     df = df[mask]
     _write_assignments_df(df, assignments_csv)
+    _mark_dirty(assignments_csv, _cells_for_rows(removed))
+    _update_summaries(assignments_csv, previous_stamp, removed=removed)
 
 
 # build weekly schedule df
@@ -315,6 +603,18 @@ def save_weekly_schedule_csv(
         week_ending: str | date,
         output_dir: str | os.PathLike = ".",
 ) -> Path:
+    output_path = _weekly_schedule_path(week_ending, output_dir)
+
+    _ensure_parent_dir(output_path)
+    content = _render_weekly_schedule_csv(schedule_df)
+    output_path.write_bytes(content)
+    _remember_export_hash(output_path, hashlib.sha256(content).hexdigest())
+
+    return output_path
+
+
+# export path for a week
+def _weekly_schedule_path(week_ending: str | date, output_dir: str | os.PathLike = ".") -> Path:
     week_date = _parse_week_ending(week_ending)
 
     month = week_date.month
@@ -322,12 +622,35 @@ def save_weekly_schedule_csv(
     year = week_date.year
 
     filename = f"{month}_{day}_{year}_Week_Ending_Schedule.csv"
-    output_path = Path(output_dir) / filename
+    return Path(output_dir) / filename
 
-    _ensure_parent_dir(output_path)
-    schedule_df.to_csv(output_path, lineterminator="\n")
 
-    return output_path
+# render schedule df as csv bytes
+def _render_weekly_schedule_csv(schedule_df: pd.DataFrame) -> bytes:
+    return schedule_df.to_csv(lineterminator="\n").encode("utf-8")
+
+
+# cache the hash of an export we just wrote
+def _remember_export_hash(path: Path, digest: str) -> None:
+    stat = path.stat()
+    _export_hashes[path] = (digest, stat.st_mtime_ns, stat.st_size)
+
+
+# hash of an existing export, reused only while the file is unchanged on disk
+def _existing_export_hash(path: Path) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _export_hashes.pop(path, None)
+        return None
+
+    cached = _export_hashes.get(path)
+    if cached and cached[1:] == (stat.st_mtime_ns, stat.st_size):
+        return cached[0]
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _export_hashes[path] = (digest, stat.st_mtime_ns, stat.st_size)
+    return digest
 
 
 # build and save schedule
@@ -343,15 +666,102 @@ def build_and_save_weekly_schedule(
     return save_weekly_schedule_csv(schedule_df, week_ending, output_dir=output_dir)
 
 
+# regenerate exports for dirty weeks only, writing files whose content changed
+def refresh_weekly_exports(
+        employee_csv: str | os.PathLike = "employee.csv",
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+        output_dir: str | os.PathLike = ".",
+) -> list[Path]:
+    weeks = get_dirty_weeks(assignments_csv)
+    if not weeks:
+        return []
+
+    employees = load_employee_df(employee_csv)
+    assignments = load_assignments_df(assignments_csv, create_if_missing=True)
+
+    written = []
+    for week_date in sorted(weeks):
+        output_path = _weekly_schedule_path(week_date, output_dir)
+        schedule_df = build_weekly_schedule_from_assignments(week_date, employees, assignments)
+        content = _render_weekly_schedule_csv(schedule_df)
+        digest = hashlib.sha256(content).hexdigest()
+
+        if digest != _existing_export_hash(output_path):
+            _ensure_parent_dir(output_path)
+            output_path.write_bytes(content)
+            _remember_export_hash(output_path, digest)
+            written.append(output_path)
+
+        dirty = _dirty_cells.get(Path(assignments_csv).resolve(), set())
+        for cell in [c for c in dirty if c[0] == week_date]:
+            dirty.discard(cell)
+
+    return written
+
+
+# (mtime_ns, size) of a file, or None if missing
+def _file_stamp(path: str | os.PathLike) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# keep exports current, also picking up edits made outside this module
+def watch_weekly_exports(
+        employee_csv: str | os.PathLike = "employee.csv",
+        assignments_csv: str | os.PathLike = "weekly_assignments.csv",
+        output_dir: str | os.PathLike = ".",
+        poll_seconds: float = 1.0,
+        max_polls: Optional[int] = None,
+) -> None:
+    assignments = load_assignments_df(assignments_csv, create_if_missing=True)
+    last_rows = set(assignments.astype(str).itertuples(index=False, name=None))
+    last_assignments_stamp = _file_stamp(assignments_csv)
+    last_employee_stamp = _file_stamp(employee_csv)
+
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        assignments_stamp = _file_stamp(assignments_csv)
+        employee_stamp = _file_stamp(employee_csv)
+
+        if assignments_stamp != last_assignments_stamp or employee_stamp != last_employee_stamp:
+            assignments = load_assignments_df(assignments_csv, create_if_missing=True)
+            rows = set(assignments.astype(str).itertuples(index=False, name=None))
+            if employee_stamp != last_employee_stamp:
+                # every exported row can change when employee details do
+                _mark_dirty(assignments_csv, _cells_for_rows(assignments))
+            week_idx = ASSIGNMENT_COLUMNS.index("WeekEndingSunday")
+            emp_idx = ASSIGNMENT_COLUMNS.index("EmployeeID")
+            _mark_dirty(assignments_csv, ((row[week_idx], row[emp_idx]) for row in rows ^ last_rows))
+            last_rows = rows
+            last_assignments_stamp = assignments_stamp
+            last_employee_stamp = employee_stamp
+
+        for path in refresh_weekly_exports(employee_csv, assignments_csv, output_dir):
+            print(f"{GREEN}✓ Updated {path}{RESET}")
+
+        polls += 1
+        if max_polls is None or polls < max_polls:
+            time.sleep(poll_seconds)
+
+
 # main for testing
 if __name__ == "__main__":
     print("=" * 60)
     print("CSV SCHEDULE REPOSITORY (CRUD + EXPORT)")
     print("=" * 60)
-    week_str = input("Enter week-ending Sunday (YYYY-MM-DD): ").strip()
+    week_str = input("Enter week-ending Sunday (YYYY-MM-DD) or 'watch': ").strip()
 
     try:
-        path = build_and_save_weekly_schedule(week_str)
-        print(f"\n{GREEN}✓ Schedule exported to: {path.resolve()}{RESET}")
+        if week_str.lower() == "watch":
+            print("Watching for changes (Ctrl+C to stop)...")
+            watch_weekly_exports()
+        else:
+            path = build_and_save_weekly_schedule(week_str)
+            print(f"\n{GREEN}✓ Schedule exported to: {path.resolve()}{RESET}")
+    except KeyboardInterrupt:
+        print(f"\n{YELLOW}Stopped watching.{RESET}")
     except Exception as exc:
         print(f"\n{RED}✗ Error: {exc}{RESET}")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from schedule_optimizer import Event, _event_window, event_from_dict, optimize_schedule, worker_covers
+
+# roster seen by pool processes, set once per process
+_shared_workers: list[dict] = []
+
+
+# outcome of one what-if plan
+@dataclass(frozen=True)
+class ScenarioResult:
+    name: str
+    needed: int
+    filled: int
+    fill_rate: float
+    fairness_spread: float
+    unfilled: dict[tuple[str, date, str], int]
+
+
+# give pool processes the roster
+def _init_shared_workers(workers: list[dict]) -> None:
+    global _shared_workers
+    _shared_workers = workers
+
+
+# evaluate one plan against the shared roster
+def _run_scenario(name: str, events: list[Event], time_limit: float) -> ScenarioResult:
+    workers = _shared_workers
+    result = optimize_schedule(events, workers, time_limit=time_limit)
+
+    # hours per worker who could have taken at least one of these shifts
+    eligible = {
+        str(w["id"]) for w in workers
+        for event in events
+        if any(role in w.get("roles", []) for role in event.roles_needed) and worker_covers(w, event)
+    }
+    hours = Counter({worker_id: 0.0 for worker_id in eligible})
+    for a in result.assignments:
+        start, end = _event_window(a.event)
+        hours[a.worker_id] += (end - start) / 60
+    spread = max(hours.values()) - min(hours.values()) if hours else 0.0
+
+    return ScenarioResult(
+        name=name,
+        needed=result.total_needed,
+        filled=len(result.assignments),
+        fill_rate=result.fill_rate,
+        fairness_spread=round(spread, 2),
+        unfilled=result.unfilled,
+    )
+
+
+# run many plans in parallel without touching saved schedules
+def run_scenarios(
+        scenarios: dict[str, list[Event]],
+        workers: list[dict],
+        time_limit: float = 5.0,
+        processes: Optional[int] = None,
+) -> list[ScenarioResult]:
+    if not scenarios:
+        return []
+
+    processes = max(1, min(processes or os.cpu_count() or 1, len(scenarios)))
+    if processes == 1:
+        _init_shared_workers(workers)
+        return [_run_scenario(name, events, time_limit) for name, events in scenarios.items()]
+
+    # where fork is the platform default the children inherit the roster;
+    # elsewhere (spawn on macOS/Windows) each process gets it once via the initializer
+    if multiprocessing.get_start_method() == "fork":
+        _init_shared_workers(workers)
+        pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_shared_workers, initargs=(workers,))
+
+    with pool:
+        futures = [pool.submit(_run_scenario, name, events, time_limit) for name, events in scenarios.items()]
+        return [future.result() for future in futures]
+
+
+# run roles_needed variants for one event
+def run_roles_needed_variants(
+        variants: list[dict[str, int]],
+        event_date: str | date,
+        start_time: str,
+        end_time: str,
+        workers: list[dict],
+        event_name: str = "Event",
+        time_limit: float = 5.0,
+        processes: Optional[int] = None,
+) -> list[ScenarioResult]:
+    scenarios = {}
+    for i, roles_needed in enumerate(variants, 1):
+        event = event_from_dict({
+            "name": event_name,
+            "date": event_date,
+            "start_time": start_time,
+            "end_time": end_time,
+            "roles_needed": roles_needed,
+        })
+        scenarios[f"Scenario {i}"] = [event]
+    return run_scenarios(scenarios, workers, time_limit=time_limit, processes=processes)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+SCHEDULE_FORMAT_VERSION = 2
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+# index workers by id for hydration
+def build_worker_index(workers: list[dict]) -> dict[str, dict]:
+    return {str(w["id"]): w for w in workers if w.get("id")}
+
+
+# check whether data is the compact id-based layout
+def is_compact(data: dict) -> bool:
+    return isinstance(data, dict) and data.get("version") == SCHEDULE_FORMAT_VERSION
+
+
+# find the id of a legacy {name, contact} entry
+def _resolve_legacy_person(person: dict, workers: list[dict]) -> str | None:
+    name = person.get("name")
+    matches = [w for w in workers if w.get("name") == name and w.get("id")]
+    exact = [w for w in matches if w.get("contact") == person.get("contact")]
+    if len(exact) == 1:
+        return str(exact[0]["id"])
+    if len(matches) == 1:
+        return str(matches[0]["id"])
+    return None
+
+
+# convert in-memory schedule into the compact layout
+def compact_schedule(schedule: dict, workers: list[dict]) -> dict:
+    worker_index = build_worker_index(workers)
+    events: dict[str, dict[str, dict]] = {}
+    for event_date, roles in schedule.items():
+        by_event = events.setdefault(event_date, {})
+        for role, staff in roles.items():
+            for person in staff:
+                key = person.get("event", "")
+                start_time, end_time = person.get("start_time", ""), person.get("end_time", "")
+                event = by_event.setdefault(key, {"start_time": start_time, "end_time": end_time, "roles": {}})
+                slot = event["roles"].setdefault(role, [])
+                worker_id = person.get("id") or _resolve_legacy_person(person, workers)
+
+                entry = {}
+                if worker_id:
+                    entry["id"] = str(worker_id)
+                # workers no longer on the roster keep their details inline
+                if not worker_id or str(worker_id) not in worker_index:
+                    entry["name"] = person.get("name", "")
+                    entry["contact"] = person.get("contact", "")
+                # a shift whose times differ from the event's keeps its own
+                if (start_time, end_time) != (event["start_time"], event["end_time"]):
+                    entry["start_time"] = start_time
+                    entry["end_time"] = end_time
+                slot.append(entry["id"] if list(entry) == ["id"] else entry)
+    return {"version": SCHEDULE_FORMAT_VERSION, "events": events}
+
+
+# expand the compact layout into display-ready schedule entries
+def hydrate_schedule(data: dict, worker_index: dict[str, dict]) -> dict:
+    schedule: dict[str, dict[str, list[dict]]] = {}
+    for event_date, by_event in data.get("events", {}).items():
+        roles = schedule.setdefault(event_date, {})
+        for event_name, event in by_event.items():
+            for role, slot in event.get("roles", {}).items():
+                staff = roles.setdefault(role, [])
+                for entry in slot:
+                    if not isinstance(entry, dict):
+                        entry = {"id": str(entry)}
+                    if "name" in entry:
+                        person = {"name": entry.get("name", ""), "contact": entry.get("contact", "")}
+                        if entry.get("id"):
+                            person["id"] = entry["id"]
+                    else:
+                        worker = worker_index.get(str(entry.get("id")), {})
+                        person = {
+                            "id": str(entry.get("id")),
+                            "name": worker.get("name", f"Unknown ({entry.get('id')})"),
+                            "contact": worker.get("contact", ""),
+                        }
+                    if event_name:
+                        person["event"] = event_name
+                    start_time = entry.get("start_time", event.get("start_time"))
+                    end_time = entry.get("end_time", event.get("end_time"))
+                    if start_time and end_time:
+                        person["start_time"] = start_time
+                        person["end_time"] = end_time
+                    staff.append(person)
+    return schedule
+
+
+# read schedule file, gzip or plain
+def read_schedule_file(path: str | os.PathLike) -> dict:
+    raw = Path(path).read_bytes()
+    if raw.startswith(GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8")) if raw.strip() else {}
+
+
+# write schedule file compactly; gzip when asked, or by default when the path ends in .gz
+def write_schedule_file(path: str | os.PathLike, data: dict, compress: bool | None = None) -> None:
+    path = Path(path)
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    if compress is None:
+        compress = path.suffix == ".gz"
+    if compress:
+        payload = gzip.compress(payload)
+
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_bytes(payload)
+    temp_path.replace(path)
+
+
+# load any schedule file into display-ready form
+def load_schedule_file(path: str | os.PathLike, workers: list[dict]) -> tuple[dict, bool]:
+    data = read_schedule_file(path)
+    if is_compact(data):
+        return hydrate_schedule(data, build_worker_index(workers)), False
+    # legacy layout already holds display data; round-trip it to attach ids
+    return hydrate_schedule(compact_schedule(data, workers), build_worker_index(workers)), True
+
+
+# rewrite a legacy schedule file in the compact layout
+def migrate_schedule_file(
+        path: str | os.PathLike,
+        workers: list[dict],
+        output_path: str | os.PathLike | None = None,
+) -> bool:
+    data = read_schedule_file(path)
+    if is_compact(data):
+        return False
+    write_schedule_file(output_path or path, compact_schedule(data, workers))
+    return True
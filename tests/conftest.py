@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import schedule_repository  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: timing thresholds for large assignment files")
+
+
+# module-level export/summary caches must not leak between tests
+@pytest.fixture(autouse=True)
+def reset_repository_state():
+    schedule_repository._dirty_cells.clear()
+    schedule_repository._export_hashes.clear()
+    schedule_repository._summary_indexes.clear()
+    yield
+    schedule_repository._dirty_cells.clear()
+    schedule_repository._export_hashes.clear()
+    schedule_repository._summary_indexes.clear()
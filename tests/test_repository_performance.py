@@ -0,0 +1,93 @@
+import csv
+import os
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+import schedule_repository as repo
+from schedule_repository import ASSIGNMENT_COLUMNS, DAYS_OF_WEEK
+
+ROOT = Path(repo.__file__).resolve().parent
+
+# seconds allowed per call; SCHEDULE_PERF_SLACK scales them for slow machines
+THRESHOLDS = {
+    10_000: {"load": 0.5, "build": 0.75, "next_id": 0.1, "create": 1.0, "summary": 1.0},
+    100_000: {"load": 2.5, "build": 5.0, "next_id": 1.0, "create": 6.0, "summary": 8.0},
+}
+SLACK = float(os.environ.get("SCHEDULE_PERF_SLACK", "1"))
+
+pytestmark = pytest.mark.perf
+
+
+# write n random assignment rows spread over ten weeks
+def write_assignments(path, n, seed=0):
+    rnd = random.Random(seed)
+    week = date(2025, 11, 30)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(ASSIGNMENT_COLUMNS)
+        for i in range(n):
+            writer.writerow([
+                f"A{i + 1:04d}",
+                (week + timedelta(weeks=i % 10)).isoformat(),
+                f"E{rnd.randint(1, 300):03d}",
+                rnd.choice(DAYS_OF_WEEK),
+                "Shift",
+                "09:00",
+                "17:00",
+                "",
+            ])
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+@pytest.fixture(params=sorted(THRESHOLDS), ids=lambda n: f"{n // 1000}k")
+def sized_csv(request, tmp_path):
+    path = tmp_path / "weekly_assignments.csv"
+    write_assignments(path, request.param)
+    return request.param, path
+
+
+def test_load_and_build_stay_fast(sized_csv):
+    n, path = sized_csv
+    limits = THRESHOLDS[n]
+    employees = repo.load_employee_df(ROOT / "employee.csv")
+
+    df, elapsed = timed(repo.load_assignments_df, path)
+    assert len(df) == n
+    assert elapsed < limits["load"] * SLACK
+
+    _, elapsed = timed(repo.build_weekly_schedule_from_assignments, "2025-11-30", employees, df)
+    assert elapsed < limits["build"] * SLACK
+
+    new_id, elapsed = timed(repo._generate_new_assignment_id, df["AssignmentID"].tolist())
+    assert new_id == f"A{n + 1:04d}"
+    assert elapsed < limits["next_id"] * SLACK
+
+
+def test_mutations_and_summaries_stay_fast(sized_csv):
+    n, path = sized_csv
+    limits = THRESHOLDS[n]
+
+    _, elapsed = timed(repo.get_employee_week_summary, "2025-11-30", "E001", assignments_csv=path)
+    assert elapsed < limits["summary"] * SLACK
+
+    created, elapsed = timed(repo.create_assignment, "2025-11-30", "E001", "Monday", "Extra", "18:00", "20:00",
+                             assignments_csv=path)
+    assert elapsed < limits["create"] * SLACK
+
+    # lookups after a mutation use the maintained index, not a rescan
+    summary, elapsed = timed(repo.get_employee_week_summary, "2025-11-30", "E001", assignments_csv=path)
+    assert any(s["AssignmentID"] == created.assignment_id for s in summary.shifts)
+    assert elapsed < 0.01 * SLACK
+
+    listed, elapsed = timed(repo.list_assignments_for_employee_week, "2025-11-30", "E001", assignments_csv=path)
+    assert created.assignment_id in listed["AssignmentID"].tolist()
+    assert elapsed < 0.01 * SLACK
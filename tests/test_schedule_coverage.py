@@ -0,0 +1,40 @@
+import numpy as np
+
+from schedule_coverage import compute_coverage
+
+DAY = "2025-12-01"
+
+
+def hours_with(row):
+    return [h for h in range(24) if row[h]]
+
+
+def test_partial_hours_round_out_for_needs_and_in_for_availability():
+    workers = [{"id": "W0001", "roles": ["Usher"], "availability": {DAY: ["09:30-12:15"]}}]
+    requirements = {DAY: {"Gala": {"start_time": "09:30", "end_time": "12:15", "roles_needed": {"Usher": 1}}}}
+    schedule = {DAY: {"Usher": [{"id": "W0001", "event": "Gala", "start_time": "09:30", "end_time": "12:15"}]}}
+    grid = compute_coverage([DAY], workers, schedule, requirements)
+
+    assert hours_with(grid.required[0, 0]) == [9, 10, 11, 12]
+    assert hours_with(grid.scheduled[0, 0]) == [9, 10, 11, 12]
+    # only 10:00-12:00 is fully covered by the availability window
+    assert hours_with(grid.available[0, 0]) == [10, 11]
+    assert hours_with(grid.available_any[0]) == [10, 11]
+
+
+def test_all_roles_availability_counts_each_worker_once():
+    workers = [
+        {"id": "W0001", "roles": ["Usher", "Security"], "availability": {DAY: ["09:00-12:00", "11:00-14:00"]}},
+        {"id": "W0002", "roles": ["Usher"], "availability": {DAY: ["10:00-10:45"]}},
+    ]
+    grid = compute_coverage([DAY], workers, {}, {})
+    usher, security = grid.roles.index("Usher"), grid.roles.index("Security")
+
+    # overlapping windows do not double count one worker
+    assert grid.available[0, usher, 11] == 1
+    assert grid.available[0, security, 11] == 1
+    assert grid.available[0, :, 11].sum() == 2
+    assert grid.available_any[0, 11] == 1
+    assert hours_with(grid.available_any[0]) == list(range(9, 14))
+    # a window shorter than a whole hour adds no available hours
+    assert np.array_equal(grid.available_any[0], grid.available[0, security])
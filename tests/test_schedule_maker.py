@@ -0,0 +1,81 @@
+import pytest
+
+import schedule_maker
+import schedule_repository as repo
+from schedule_optimizer import event_from_dict
+
+
+def worker(worker_id, roles, window="08:00-22:00"):
+    return {
+        "id": worker_id,
+        "name": f"Worker {worker_id}",
+        "contact": "555-0000",
+        "roles": roles,
+        "availability": {"2025-12-01": [window]},
+    }
+
+
+def event(name, start, end, roles_needed):
+    return event_from_dict({
+        "name": name, "date": "2025-12-01", "start_time": start, "end_time": end, "roles_needed": roles_needed,
+    })
+
+
+def scheduled_events():
+    return sorted(
+        (p["event"], p["id"])
+        for roles in schedule_maker.schedule.values()
+        for staff in roles.values()
+        for p in staff
+    )
+
+
+def csv_events(path):
+    df = repo.load_assignments_df(path)
+    return sorted(zip(df["EventName"], df["EmployeeID"]))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(schedule_maker, "workers", [
+        worker("W0001", ["Usher"]),
+        worker("W0002", ["Usher"]),
+        worker("W0003", ["Security"]),
+    ])
+    monkeypatch.setattr(schedule_maker, "schedule", {})
+    monkeypatch.setattr(schedule_maker, "requirements", {})
+    return tmp_path
+
+
+def test_rerun_with_zero_fills_clears_only_that_event(app):
+    schedule_maker.run_event_optimization([
+        event("Gala", "09:00", "12:00", {"Usher": 1}),
+        event("Show", "13:00", "16:00", {"Usher": 1, "Security": 1}),
+    ])
+    assert len(scheduled_events()) == 3
+    expected = [row for row in scheduled_events() if row[0] == "Show"]
+
+    # nobody holds this role, so the re-run fills nothing
+    result = schedule_maker.run_event_optimization([event("Gala", "09:00", "12:00", {"Juggler": 2})])
+    assert result.assignments == []
+
+    assert scheduled_events() == expected
+    assert csv_events(app / schedule_maker.ASSIGNMENTS_FILE) == expected
+
+    # the stores agree after a reload too
+    schedule_maker.load_schedule()
+    assert scheduled_events() == expected
+    schedule_maker.load_requirements()
+    assert schedule_maker.requirements["2025-12-01"]["Gala"]["roles_needed"] == {"Juggler": 2}
+    assert schedule_maker.requirements["2025-12-01"]["Show"]["roles_needed"] == {"Usher": 1, "Security": 1}
+
+
+def test_rerun_does_not_double_book_kept_shifts(app):
+    schedule_maker.run_event_optimization([event("Show", "13:00", "16:00", {"Security": 1})])
+
+    # the only Security worker is already at "Show" during these hours
+    result = schedule_maker.run_event_optimization([event("Gala", "14:00", "15:00", {"Security": 1})])
+    assert result.assignments == []
+    assert result.unfilled == {("Gala", event("Gala", "14:00", "15:00", {}).event_date, "Security"): 1}
+    assert csv_events(app / schedule_maker.ASSIGNMENTS_FILE) == [("Show", "W0003")]
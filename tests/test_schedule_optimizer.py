@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+import schedule_optimizer
+
+
+def test_load_events_rejects_duplicate_names_on_one_day(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps([
+        {"name": "Shift", "date": "2025-12-01", "start_time": "08:00", "end_time": "10:00", "roles_needed": {"Usher": 1}},
+        {"name": "Shift", "date": "2025-12-01", "start_time": "18:00", "end_time": "20:00", "roles_needed": {"Usher": 1}},
+    ]))
+    with pytest.raises(ValueError, match="Duplicate event 'Shift'"):
+        schedule_optimizer.load_events(path)
+
+
+def test_load_events_allows_same_name_on_different_days(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps([
+        {"name": "Shift", "date": "2025-12-01", "start_time": "08:00", "end_time": "10:00", "roles_needed": {"Usher": 1}},
+        {"name": "Shift", "date": "2025-12-02", "start_time": "08:00", "end_time": "10:00", "roles_needed": {"Usher": 1}},
+    ]))
+    assert len(schedule_optimizer.load_events(path)) == 2
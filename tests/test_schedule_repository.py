@@ -0,0 +1,353 @@
+import csv
+import io
+import os
+import random
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import schedule_repository as repo
+from schedule_repository import ASSIGNMENT_COLUMNS, DAYS_OF_WEEK
+
+ROOT = Path(repo.__file__).resolve().parent
+WEEKS = [date(2025, 11, 30) + timedelta(weeks=i) for i in range(3)]
+EVENTS = ["Front Desk AM", "Front Desk PM", "Chiro Appointments", "Yoga, Level 2", ""]
+TIMES = ["", "08:00", "09:00", "13:00", "17:30", "22:00"]
+EMPLOYEE_IDS = ["E001", "E002", "E003", "E999"]
+
+
+# reference: next id is one past the largest A#### id
+def ref_next_id(ids):
+    nums = [int(s[1:]) for s in ids if s.startswith("A") and s[1:].isdigit()]
+    return f"A{max(nums, default=0) + 1:04d}"
+
+
+# reference: read assignments with the csv module
+def ref_load(path):
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row["WeekEndingSunday"] = datetime.strptime(row["WeekEndingSunday"], "%Y-%m-%d").date()
+    return [{col: row.get(col, "") for col in ASSIGNMENT_COLUMNS} for row in rows]
+
+
+# reference: render the weekly export without pandas
+def ref_weekly_csv(week, employee_csv, rows):
+    with open(employee_csv, newline="") as f:
+        reader = csv.DictReader(f)
+        other_columns = [c for c in reader.fieldnames if c != "ID"]
+        employees = list(reader)
+
+    labels = {}
+    for row in rows:
+        if row["WeekEndingSunday"] != week or row["DayOfWeek"] not in DAYS_OF_WEEK:
+            continue
+        label = ": ".join(part for part in (row["EventName"].strip(), row["StartTime"].strip()) if part)
+        if label:
+            labels[(row["DayOfWeek"], row["EmployeeID"])] = label
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["ID"] + DAYS_OF_WEEK + other_columns)
+    for emp in employees:
+        days = [labels.get((day, emp["ID"]), "Off") for day in DAYS_OF_WEEK]
+        writer.writerow([emp["ID"]] + days + [emp[c] for c in other_columns])
+    return out.getvalue().encode("utf-8")
+
+
+# reference: minutes after midnight for "HH:MM"
+def ref_minutes(value):
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+# reference: hours for one employee's week; a shift ending before it starts runs past midnight
+def ref_week_hours(week, employee_id, rows):
+    total = 0
+    for row in rows:
+        if row["WeekEndingSunday"] != week or row["EmployeeID"] != employee_id:
+            continue
+        if not row["StartTime"] or not row["EndTime"]:
+            continue
+        start, end = ref_minutes(row["StartTime"]), ref_minutes(row["EndTime"])
+        if end < start:
+            end += 24 * 60
+        total += end - start
+    return round(total / 60, 2)
+
+
+# apply random create/update/delete calls to the repository and a plain-list model
+def run_random_ops(rnd, assignments_csv, model, count):
+    for _ in range(count):
+        if model:
+            op = rnd.choice(["create", "create", "update", "delete", "replace"])
+        else:
+            op = rnd.choice(["create", "replace"])
+
+        if op == "create":
+            row = {
+                "WeekEndingSunday": rnd.choice(WEEKS),
+                "EmployeeID": rnd.choice(EMPLOYEE_IDS),
+                "DayOfWeek": rnd.choice(DAYS_OF_WEEK),
+                "EventName": rnd.choice(EVENTS),
+                "StartTime": rnd.choice(TIMES),
+                "EndTime": rnd.choice(TIMES),
+                "Notes": rnd.choice(["", "cover", " trim me "]),
+            }
+            created = repo.create_assignment(
+                row["WeekEndingSunday"].isoformat(),
+                row["EmployeeID"],
+                row["DayOfWeek"],
+                row["EventName"],
+                start_time=row["StartTime"] or None,
+                end_time=row["EndTime"] or None,
+                notes=row["Notes"] or None,
+                assignments_csv=assignments_csv,
+            )
+            assert created.assignment_id == ref_next_id([r["AssignmentID"] for r in model])
+            row["AssignmentID"] = created.assignment_id
+            row["Notes"] = row["Notes"].strip()
+            model.append(row)
+
+        elif op == "update":
+            target = rnd.choice(model)
+            changes = {}
+            if rnd.random() < 0.5:
+                changes["event_name"] = rnd.choice(EVENTS)
+            if rnd.random() < 0.5:
+                changes["start_time"] = rnd.choice(TIMES)
+            if rnd.random() < 0.3:
+                changes["end_time"] = rnd.choice(TIMES)
+            if rnd.random() < 0.3:
+                changes["notes"] = rnd.choice(["", "swapped"])
+            if rnd.random() < 0.3:
+                changes["day_of_week"] = rnd.choice(DAYS_OF_WEEK)
+            repo.update_assignment(target["AssignmentID"], assignments_csv=assignments_csv, **changes)
+            fields = {
+                "event_name": "EventName",
+                "start_time": "StartTime",
+                "end_time": "EndTime",
+                "notes": "Notes",
+                "day_of_week": "DayOfWeek",
+            }
+            for arg, col in fields.items():
+                if arg in changes:
+                    target[col] = changes[arg].strip()
+
+        elif op == "delete":
+            target = model.pop(rnd.randrange(len(model)))
+            repo.delete_assignment(target["AssignmentID"], assignments_csv=assignments_csv)
+
+        else:
+            if model and rnd.random() < 0.6:
+                source = rnd.choice(model)
+                key = (source["WeekEndingSunday"], source["DayOfWeek"], source["EventName"])
+            else:
+                key = (rnd.choice(WEEKS), rnd.choice(DAYS_OF_WEEK), rnd.choice(EVENTS))
+            new_rows = [
+                {
+                    "WeekEndingSunday": key[0],
+                    "EmployeeID": rnd.choice(EMPLOYEE_IDS),
+                    "DayOfWeek": key[1],
+                    "EventName": key[2],
+                    "StartTime": rnd.choice(TIMES),
+                    "EndTime": rnd.choice(TIMES),
+                    "Notes": rnd.choice(["", "Security"]),
+                }
+                for _ in range(rnd.randint(0, 3))
+            ]
+            first_id = int(ref_next_id([r["AssignmentID"] for r in model])[1:])
+            new_ids = repo.replace_event_assignments(
+                [dict(row, WeekEndingSunday=row["WeekEndingSunday"].isoformat()) for row in new_rows],
+                assignments_csv=assignments_csv,
+                keys=[(key[0].isoformat(), key[1], key[2])],
+            )
+            assert new_ids == [f"A{first_id + i:04d}" for i in range(len(new_rows))]
+
+            model[:] = [r for r in model if (r["WeekEndingSunday"], r["DayOfWeek"], r["EventName"]) != key]
+            for row, new_id in zip(new_rows, new_ids):
+                model.append({"AssignmentID": new_id, **row})
+
+
+# pandas rows in the reference shape
+def loaded_rows(assignments_csv):
+    df = repo.load_assignments_df(assignments_csv)
+    return [{col: row[col] for col in ASSIGNMENT_COLUMNS} for row in df.to_dict(orient="records")]
+
+
+@pytest.fixture
+def employee_csv(tmp_path):
+    return shutil.copy(ROOT / "employee.csv", tmp_path / "employee.csv")
+
+
+def test_committed_week_export_matches_reference(tmp_path):
+    rows = ref_load(ROOT / "weekly_assignments.csv")
+    path = repo.build_and_save_weekly_schedule(
+        "2025-11-30",
+        employee_csv=ROOT / "employee.csv",
+        assignments_csv=ROOT / "weekly_assignments.csv",
+        output_dir=tmp_path,
+    )
+    expected = (ROOT / "11_30_2025_Week_Ending_Schedule.csv").read_bytes()
+    assert path.read_bytes() == expected
+    assert ref_weekly_csv(date(2025, 11, 30), ROOT / "employee.csv", rows) == expected
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_random_crud_round_trip_matches_reference(seed, tmp_path, employee_csv):
+    rnd = random.Random(seed)
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    model = []
+
+    for _ in range(3):
+        run_random_ops(rnd, assignments_csv, model, 15)
+
+        assert loaded_rows(assignments_csv) == model
+        assert ref_load(assignments_csv) == model
+
+        for week in WEEKS:
+            path = repo.build_and_save_weekly_schedule(
+                week, employee_csv=employee_csv, assignments_csv=assignments_csv, output_dir=tmp_path / "out"
+            )
+            assert path.read_bytes() == ref_weekly_csv(week, employee_csv, model)
+
+            for employee_id in EMPLOYEE_IDS:
+                hours = repo.get_employee_week_hours(week, employee_id, assignments_csv=assignments_csv)
+                assert hours == ref_week_hours(week, employee_id, model)
+
+                listed = repo.list_assignments_for_employee_week(week, employee_id, assignments_csv=assignments_csv)
+                assert listed.to_dict(orient="records") == [
+                    r for r in model if r["WeekEndingSunday"] == week and r["EmployeeID"] == employee_id
+                ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_refresh_matches_full_rebuild(seed, tmp_path, employee_csv):
+    rnd = random.Random(seed)
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    out = tmp_path / "out"
+    model = []
+
+    run_random_ops(rnd, assignments_csv, model, 20)
+    repo.refresh_weekly_exports(employee_csv, assignments_csv, out)
+    run_random_ops(rnd, assignments_csv, model, 10)
+    repo.refresh_weekly_exports(employee_csv, assignments_csv, out)
+
+    assert repo.get_dirty_cells(assignments_csv) == set()
+    for week in {row["WeekEndingSunday"] for row in model}:
+        exported = repo._weekly_schedule_path(week, out).read_bytes()
+        assert exported == ref_weekly_csv(week, employee_csv, model)
+
+    # nothing changed, so nothing is rewritten
+    assert repo.refresh_weekly_exports(employee_csv, assignments_csv, out) == []
+
+
+@pytest.mark.parametrize("start, end, hours", [
+    ("09:00", "17:00", 8.0),
+    ("09:00", "17:30", 8.5),
+    ("22:00", "02:00", 4.0),
+    ("23:45", "00:15", 0.5),
+    ("13:00", "13:00", 0.0),
+    ("00:00", "23:59", 23.98),
+    ("", "17:00", 0.0),
+    ("09:00", "", 0.0),
+])
+def test_shift_hours_known_values(start, end, hours):
+    assert repo._shift_hours(start, end) == hours
+
+
+def test_generate_new_assignment_id_matches_reference():
+    rnd = random.Random(7)
+    for _ in range(200):
+        ids = [f"A{rnd.randint(0, 20000):04d}" for _ in range(rnd.randint(0, 20))]
+        ids += rnd.sample(["", "B0001", "Axyz", "A", "A12a"], rnd.randint(0, 3))
+        rnd.shuffle(ids)
+        assert repo._generate_new_assignment_id(ids) == ref_next_id(ids)
+
+
+def test_blank_text_cells_load_as_empty_strings(tmp_path):
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    assignments_csv.write_text(
+        ",".join(ASSIGNMENT_COLUMNS) + "\nA0001,2025-11-30,E001,Monday,,,,\n"
+    )
+    repo.update_assignment("A0001", notes="covering", assignments_csv=assignments_csv)
+    assert loaded_rows(assignments_csv)[0]["Notes"] == "covering"
+    assert loaded_rows(assignments_csv)[0]["EventName"] == ""
+
+
+@pytest.mark.parametrize("header_only", [False, True])
+def test_replace_event_assignments_on_missing_or_empty_file(header_only, tmp_path):
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    if header_only:
+        assignments_csv.write_text(",".join(ASSIGNMENT_COLUMNS) + "\n")
+
+    # nothing to add or clear still leaves a loadable file
+    assert repo.replace_event_assignments([], assignments_csv=assignments_csv) == []
+    assert assignments_csv.read_text() == ",".join(ASSIGNMENT_COLUMNS) + "\n"
+
+    row = {
+        "WeekEndingSunday": "2025-11-30",
+        "EmployeeID": "E001",
+        "DayOfWeek": "Monday",
+        "EventName": "Gala",
+        "StartTime": "17:00",
+        "EndTime": "19:00",
+    }
+    assert repo.replace_event_assignments([row], assignments_csv=assignments_csv) == ["A0001"]
+    assert [r["EventName"] for r in loaded_rows(assignments_csv)] == ["Gala"]
+    assert repo.get_dirty_cells(assignments_csv) == {(date(2025, 11, 30), "E001")}
+
+    # clearing by key with no new rows empties the file back to its header
+    repo.replace_event_assignments([], assignments_csv=assignments_csv, keys=[("2025-11-30", "Monday", "Gala")])
+    assert loaded_rows(assignments_csv) == []
+
+
+def test_refresh_recreates_deleted_export(tmp_path, employee_csv):
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    out = tmp_path / "out"
+    repo.create_assignment("2025-11-30", "E001", "Monday", "Front Desk AM", "09:00", assignments_csv=assignments_csv)
+    (path,) = repo.refresh_weekly_exports(employee_csv, assignments_csv, out)
+
+    path.unlink()
+    repo.create_assignment("2025-11-30", "E002", "Monday", "Front Desk PM", "13:00", assignments_csv=assignments_csv)
+    assert repo.refresh_weekly_exports(employee_csv, assignments_csv, out) == [path]
+    assert path.exists()
+
+    # a hand-edited export is noticed and rewritten on the next change to its week
+    path.write_text("stale\n")
+    repo.update_assignment("A0002", start_time="14:00", assignments_csv=assignments_csv)
+    assert repo.refresh_weekly_exports(employee_csv, assignments_csv, out) == [path]
+    assert path.read_text() != "stale\n"
+
+
+def test_dirty_cells_are_tracked_per_assignments_file(tmp_path, employee_csv):
+    first_csv, second_csv = tmp_path / "first.csv", tmp_path / "second.csv"
+    repo.create_assignment("2025-11-30", "E001", "Monday", "Gala", "09:00", assignments_csv=first_csv)
+    repo.create_assignment("2025-11-30", "E002", "Tuesday", "Show", "13:00", assignments_csv=second_csv)
+
+    # refreshing one file's exports leaves the other file's changes pending
+    assert repo.refresh_weekly_exports(employee_csv, first_csv, tmp_path / "first")
+    assert repo.get_dirty_cells(first_csv) == set()
+    assert repo.get_dirty_cells(second_csv) == {(date(2025, 11, 30), "E002")}
+
+    (path,) = repo.refresh_weekly_exports(employee_csv, second_csv, tmp_path / "second")
+    assert "Show: 13:00" in path.read_text()
+    assert repo.get_dirty_cells(second_csv) == set()
+
+
+def test_summary_notices_outside_edit_with_same_mtime(tmp_path):
+    assignments_csv = tmp_path / "weekly_assignments.csv"
+    repo.create_assignment("2025-11-30", "E001", "Monday", "Gala", "09:00", "12:00", assignments_csv=assignments_csv)
+    assert repo.get_employee_week_hours("2025-11-30", "E001", assignments_csv=assignments_csv) == 3.0
+
+    # an edit that lands within the same clock tick keeps mtime but not size
+    stat = assignments_csv.stat()
+    with open(assignments_csv, "a") as f:
+        f.write("A0002,2025-11-30,E001,Tuesday,Show,13:00,15:00,\n")
+    os.utime(assignments_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert repo.get_employee_week_hours("2025-11-30", "E001", assignments_csv=assignments_csv) == 5.0
+    listed = repo.list_assignments_for_employee_week("2025-11-30", "E001", assignments_csv=assignments_csv)
+    assert listed["AssignmentID"].tolist() == ["A0001", "A0002"]
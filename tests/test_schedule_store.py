@@ -0,0 +1,76 @@
+import schedule_store as store
+
+WORKERS = [
+    {"id": "W0001", "name": "Ada", "contact": "555-0001"},
+    {"id": "W0002", "name": "Grace", "contact": "555-0002"},
+    {"id": "W0003", "name": "Alan", "contact": "555-0003"},
+]
+
+
+def person(worker_id, event, start, end):
+    worker = store.build_worker_index(WORKERS)[worker_id]
+    return {
+        "id": worker_id, "name": worker["name"], "contact": worker["contact"],
+        "event": event, "start_time": start, "end_time": end,
+    }
+
+
+def round_trip(schedule, workers=WORKERS):
+    return store.hydrate_schedule(store.compact_schedule(schedule, workers), store.build_worker_index(workers))
+
+
+def test_round_trip_keeps_per_shift_times():
+    # same event name twice on one day at different hours, across two roles
+    schedule = {
+        "2025-12-01": {
+            "Usher": [person("W0001", "Event", "09:00", "12:00"), person("W0002", "Event", "13:00", "17:00")],
+            "Security": [person("W0003", "Event", "13:00", "17:00")],
+        },
+        "2025-12-02": {"Usher": [person("W0001", "Gala", "18:00", "22:00")]},
+    }
+    assert round_trip(schedule) == schedule
+
+    # shifts matching the event's times stay bare ids
+    compact = store.compact_schedule(schedule, WORKERS)
+    assert compact["events"]["2025-12-02"]["Gala"]["roles"]["Usher"] == ["W0001"]
+
+
+def test_round_trip_keeps_deleted_workers_inline():
+    schedule = {"2025-12-01": {"Usher": [person("W0002", "Event", "09:00", "12:00")]}}
+    remaining = [w for w in WORKERS if w["id"] != "W0002"]
+    assert round_trip(schedule, remaining) == schedule
+
+
+def test_legacy_file_migrates_and_loads_the_same(tmp_path):
+    legacy = {
+        "2025-12-01": {
+            "Usher": [
+                {"name": "Ada", "contact": "555-0001", "event": "Event", "start_time": "09:00", "end_time": "12:00"},
+                {"name": "Grace", "contact": "555-0002", "event": "Event", "start_time": "13:00", "end_time": "17:00"},
+            ],
+            "Security": [{"name": "Former", "contact": "555-0099"}],
+        }
+    }
+    path = tmp_path / "schedule.json"
+    store.write_schedule_file(path, legacy)
+
+    before, was_legacy = store.load_schedule_file(path, WORKERS)
+    assert was_legacy
+    assert store.migrate_schedule_file(path, WORKERS)
+    assert not store.migrate_schedule_file(path, WORKERS)
+
+    after, was_legacy = store.load_schedule_file(path, WORKERS)
+    assert not was_legacy
+    assert after == before
+    assert after["2025-12-01"]["Usher"] == [
+        person("W0001", "Event", "09:00", "12:00"), person("W0002", "Event", "13:00", "17:00"),
+    ]
+    assert after["2025-12-01"]["Security"] == [{"name": "Former", "contact": "555-0099"}]
+
+
+def test_gzip_file_round_trips(tmp_path):
+    schedule = {"2025-12-01": {"Usher": [person("W0001", "Gala", "09:00", "12:00")]}}
+    path = tmp_path / "schedule.json.gz"
+    store.write_schedule_file(path, store.compact_schedule(schedule, WORKERS))
+    assert path.read_bytes().startswith(store.GZIP_MAGIC)
+    assert store.load_schedule_file(path, WORKERS) == (schedule, False)